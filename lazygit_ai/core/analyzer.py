@@ -7,6 +7,7 @@ to provide comprehensive context for commit message generation.
 
 import re
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any
 
@@ -164,25 +165,18 @@ class GitAnalyzer:
             
             # If diff is too large, get a truncated version
             if len(size_result.stdout) > MAX_DIFF_SIZE:
-                # Get only the first part of the diff
-                result = subprocess.run(
-                    ["git", "diff", "--cached", "--no-color"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.git.repo_path,
-                    check=True,
-                )
-                
-                diff_content = result.stdout
-                lines = diff_content.split('\n')
+                # Read only the first part of the diff and stop git there
+                diff_lines = self.git.iter_staged_diff()
+                try:
+                    lines = list(islice(diff_lines, MAX_DIFF_LINES + 1))
+                finally:
+                    diff_lines.close()
                 
                 if len(lines) > MAX_DIFF_LINES:
                     # Truncate to MAX_DIFF_LINES and add truncation notice
-                    truncated_lines = lines[:MAX_DIFF_LINES]
-                    truncated_lines.append(f"\n... (diff truncated at {MAX_DIFF_LINES} lines)")
-                    return '\n'.join(truncated_lines)
+                    return "".join(lines[:MAX_DIFF_LINES]) + f"\n... (diff truncated at {MAX_DIFF_LINES} lines)"
                 
-                return diff_content
+                return "".join(lines)
             else:
                 # Normal diff processing
                 return self.git.get_staged_diff()
@@ -237,18 +231,28 @@ class GitAnalyzer:
         try:
             import subprocess
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "status", "--porcelain", "-z"],
                 capture_output=True,
-                text=True,
                 cwd=self.git.repo_path,
                 check=True,
             )
             
+            # Entries are "XY path" with the path always at byte 3
+            entries = result.stdout.split(b"\0")
             unstaged_files = []
-            for line in result.stdout.strip().split("\n"):
-                if line and line[1] in "MDR":  # Modified, Deleted, Renamed (unstaged)
-                    file_path = line[3:]  # Remove status prefix
-                    unstaged_files.append(file_path)
+            i = 0
+            while i < len(entries):
+                entry = entries[i]
+                i += 1
+                if len(entry) < 4:
+                    continue
+                
+                if entry[1:2] in b"MDR":  # Modified, Deleted, Renamed (unstaged)
+                    unstaged_files.append(entry[3:].decode("utf-8", "replace"))
+                
+                # Renames and copies are followed by their original path
+                if entry[0:1] in b"RC" or entry[1:2] in b"RC":
+                    i += 1
             
             return unstaged_files
         except subprocess.CalledProcessError:
@@ -13,6 +13,16 @@ from .analyzer import GitAnalysis
 from ..utils.config import ConfigManager
 
 
+# Common imperative verbs for commit messages (tuple for str.startswith)
+COMMIT_VERBS = (
+    "add", "update", "fix", "remove", "refactor", "improve", "enhance",
+    "implement", "create", "delete", "modify", "change", "optimize",
+    "clean", "format", "style", "test", "document", "configure",
+    "bump", "upgrade", "downgrade", "replace", "rename", "move"
+)
+VERB_PREFIX_LENGTH = max(len(verb) for verb in COMMIT_VERBS)
+
+
 @dataclass
 class CommitPattern:
     """Represents a commit pattern with type, scope, and description."""
@@ -404,15 +414,11 @@ class EnhancedRuleEngine:
         if analysis.scope_suggestions:
             return self._format_scope(analysis.scope_suggestions[0])
         
-        # Try to infer from file paths
-        scopes = set()
+        # Try to infer from file paths (first top-level directory wins)
         for file_path in analysis.staged_files:
-            path_parts = file_path.split("/")
-            if len(path_parts) > 1:
-                scopes.add(path_parts[0])
-        
-        if scopes:
-            return self._format_scope(list(scopes)[0])
+            top_dir, sep, _ = file_path.partition("/")
+            if sep and top_dir:
+                return self._format_scope(top_dir)
         
         return None
     
@@ -521,8 +527,8 @@ class EnhancedRuleEngine:
     
     def _clean_description(self, text: str) -> str:
         """Clean and format description text."""
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text.strip())
+        # Remove extra whitespace; str.split() knows the same Unicode spaces as \s
+        text = " ".join(text.split())
         
         # Remove common prefixes
         text = re.sub(r"^(TODO|FIX|BUG)[:\s]*", "", text, flags=re.IGNORECASE)
@@ -601,20 +607,9 @@ class EnhancedRuleEngine:
     
     def _ensure_verb_start(self, text: str) -> str:
         """Ensure description starts with a verb."""
-        # Common verbs for commit messages
-        verbs = [
-            "add", "update", "fix", "remove", "refactor", "improve", "enhance",
-            "implement", "create", "delete", "modify", "change", "optimize",
-            "clean", "format", "style", "test", "document", "configure",
-            "bump", "upgrade", "downgrade", "replace", "rename", "move"
-        ]
-        
-        text_lower = text.lower()
-        
-        # Check if it already starts with a verb
-        for verb in verbs:
-            if text_lower.startswith(verb):
-                return text
+        # Check if it already starts with a verb (only the prefix matters)
+        if text[:VERB_PREFIX_LENGTH].lower().startswith(COMMIT_VERBS):
+            return text
         
         # Try to extract action from common patterns
         patterns = [
@@ -626,7 +621,7 @@ class EnhancedRuleEngine:
         ]
         
         for pattern in patterns:
-            match = re.match(pattern, text_lower)
+            match = re.match(pattern, text, re.IGNORECASE)
             if match:
                 return text
         
@@ -722,23 +717,11 @@ class EnhancedRuleEngine:
     def _is_imperative(self, message: str) -> bool:
         """Check if message uses imperative mood."""
         # Remove conventional commit prefix
-        if ":" in message:
-            message = message.split(":", 1)[1].strip()
-        
-        # Common imperative verbs
-        imperative_verbs = [
-            "add", "update", "fix", "remove", "refactor", "improve", "enhance",
-            "implement", "create", "delete", "modify", "change", "optimize",
-            "clean", "format", "style", "test", "document", "configure",
-            "bump", "upgrade", "downgrade", "replace", "rename", "move"
-        ]
-        
-        message_lower = message.lower()
-        for verb in imperative_verbs:
-            if message_lower.startswith(verb):
-                return True
+        _, sep, rest = message.partition(":")
+        if sep:
+            message = rest.strip()
         
-        return False
+        return message[:VERB_PREFIX_LENGTH].lower().startswith(COMMIT_VERBS)
 
 
 # Backward compatibility - alias the new class to the old name
@@ -4,7 +4,6 @@ Display management for lazygit-ai.
 Handles rich terminal output, user interface elements, and clipboard operations.
 """
 
-import pyperclip
 from typing import List
 
 from rich.console import Console
@@ -111,6 +110,7 @@ class DisplayManager:
     def copy_to_clipboard(self, message: str) -> bool:
         """Copy message to clipboard."""
         try:
+            import pyperclip
             pyperclip.copy(message)
             return True
         except Exception as e:
@@ -167,7 +167,8 @@ class DisplayManager:
         
         self.console.print("\n[bold]📄 Diff Preview:[/bold]")
         
-        lines = diff.split("\n")
+        # maxsplit stops scanning once we have enough lines for the preview
+        lines = diff.split("\n", max_lines)
         if len(lines) > max_lines:
             lines = lines[:max_lines]
             lines.append("... (truncated)")
@@ -195,20 +196,17 @@ class DisplayManager:
         table.add_column("Type", style="green")
         table.add_column("Status", style="yellow")
         
+        # Invert file_types once so each lookup is O(1)
+        path_to_type = {}
+        for type_name, files in analysis.file_types.items():
+            for path in files:
+                path_to_type.setdefault(path, type_name)
+        
         for file_path in analysis.staged_files:
-            # Determine file type
-            file_type = "other"
-            for type_name, files in analysis.file_types.items():
-                if file_path in files:
-                    file_type = type_name
-                    break
-            
-            # Determine status (simplified)
-            status = "modified"
-            if file_path in analysis.staged_files:
-                status = "staged"
+            file_type = path_to_type.get(file_path, "other")
             
-            table.add_row(file_path, file_type, status)
+            # Every file listed here comes from staged_files
+            table.add_row(file_path, file_type, "staged")
         
         self.console.print(table)
     
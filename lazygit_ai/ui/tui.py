@@ -4,14 +4,32 @@ Simple TUI for lazygit-ai.
 Provides a clean, LazyGit-style interface for commit message editing.
 """
 
-import pyperclip
+import base64
+import bisect
 import sys
 import os
-import threading
+import re
+import select
+import selectors
 import time
-import tty
-import termios
-from typing import Optional, Callable
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows has no POSIX terminal control
+    termios = None
+    tty = None
+
+try:
+    import msvcrt
+except ImportError:  # Only available on Windows
+    msvcrt = None
+
+try:
+    import readline
+except ImportError:  # Missing on Windows and some minimal builds
+    readline = None
 
 from rich.console import Console, Group
 from rich.text import Text
@@ -22,146 +40,286 @@ from ..core.analyzer import GitAnalysis
 from ..utils.git import GitWrapper
 
 
+# Static markup, parsed once at import instead of on every redraw
+MAIN_PANEL_TITLE = Text.from_markup("[bold blue]🚀 lazygit-ai - Commit Message Editor[/bold blue]")
+MESSAGE_PANEL_TITLE = Text.from_markup("[bold yellow]✎ Edit commit message[/bold yellow]")
+MESSAGE_PREFIX = Text.from_markup("[bold yellow]✎[/bold yellow] ")
+ACTIONS_TEXT = Text.from_markup(
+    "[dim]Press Enter to finish editing, a to accept, c to copy, q to quit[/dim]"
+)
+UNSTAGED_WARNING_TEXT = Text.from_markup(
+    "[yellow]⚠️  You also have unstaged changes. Only staged changes will be committed.[/yellow]"
+)
+EMPTY_TEXT = Text("")
+
+# Raw byte sequences the in-place editor understands
+KEY_SEQUENCES = {
+    b'\x1b[D': 'LEFT',
+    b'\x1b[C': 'RIGHT',
+    b'\x1b[H': 'HOME',
+    b'\x1b[F': 'END',
+    b'\x7f': 'BACKSPACE',
+    b'\x04': 'CTRL_D',
+    b'\r': 'ENTER',
+}
+
+# Terminal control sequences, kept as bytes so they skip the text encoder.
+# CURSOR_MOVE takes 1-based (row, col).
+CURSOR_MOVE = b"\033[%d;%dH"
+CURSOR_BACK = b"\033[%dD"
+CURSOR_FORWARD = b"\033[%dC"
+# Prebuilt relative moves for the usual short hops, indexed by distance
+CURSOR_BACK_STEPS = (b"", b"\033[D") + tuple(CURSOR_BACK % n for n in range(2, 64))
+CURSOR_FORWARD_STEPS = (b"", b"\033[C") + tuple(CURSOR_FORWARD % n for n in range(2, 64))
+CLEAR_LINE = b"\033[K"
+DELETE_BACK = b"\b\033[P"
+INSERT_BLANKS = b"\033[%d@"
+HIDE_CURSOR = b"\033[?25l"
+SHOW_CURSOR = b"\033[?25h"
+SAVE_CURSOR = b"\0337"
+RESTORE_CURSOR = b"\0338"
+# OSC 52: ask the terminal itself to set the system clipboard
+OSC52_COPY = b"\033]52;c;%s\a"
+
+# Splits a raw input burst into CSI sequences, control bytes and runs of text
+KEY_TOKEN_RE = re.compile(rb'\x1b\[[0-?]*[ -/]*[@-~]|[\x00-\x1f\x7f]|[^\x00-\x1f\x7f]+')
+
+# How long to keep collecting a burst of input before redrawing
+INPUT_BURST_WINDOW = 0.016
+
+
 class InPlaceEditor:
     """In-place text editor for terminal input."""
     
     def __init__(self, initial_text: str = "", max_width: int = 80):
-        self.text = initial_text
-        self.cursor_pos = len(initial_text)
+        # Gap buffer: characters before the cursor, and characters after it
+        # stored reversed, so edits at the cursor are O(1) list push/pop
+        self._left: List[str] = list(initial_text)
+        self._right: List[str] = []
+        # Sorted offsets of every newline, so columns come from a bisect
+        self._newlines = [i for i, ch in enumerate(initial_text) if ch == '\n']
+        self.cursor_row = len(self._newlines)
+        self.cursor_col = self._line_column()
         self.max_width = max_width
         self.editing = False
+        self._out = bytearray()
+        self._stdout_fd = 1
+        # Formatted CUP sequences by (row, col); the panel origin is fixed per session
+        self._moves: Dict[Tuple[int, int], bytes] = {}
+        # Where the terminal cursor is known to be, or None when unknown
+        self._at: Optional[Tuple[int, int]] = None
     
-    def _get_cursor_position(self, text: str, target_pos: int) -> tuple[int, int]:
-        """Calculate cursor position in terms of row and column."""
-        lines = text.split('\n')
-        row = 0
-        col = 0
-        pos = 0
-        
-        for line in lines:
-            if pos + len(line) >= target_pos:
-                col = target_pos - pos
-                break
-            pos += len(line) + 1  # +1 for newline
-            row += 1
-        
-        return row, col
+    @property
+    def text(self) -> str:
+        """Return the full text being edited."""
+        return ''.join(self._left) + ''.join(reversed(self._right))
+    
+    @text.setter
+    def text(self, value: str) -> None:
+        """Replace the text and put the cursor at its end."""
+        self._left = list(value)
+        self._right = []
+        self._newlines = [i for i, ch in enumerate(value) if ch == '\n']
+    
+    @property
+    def cursor_pos(self) -> int:
+        """Return the cursor offset into the text."""
+        return len(self._left)
+    
+    def _line_column(self) -> int:
+        """Return the cursor's column within its own line."""
+        pos = len(self._left)
+        row = bisect.bisect_left(self._newlines, pos)
+        return pos - (self._newlines[row - 1] + 1) if row else pos
+    
+    def _shift_newlines(self, start: int, delta: int) -> None:
+        """Shift newline offsets at or after start by delta."""
+        for i in range(bisect.bisect_left(self._newlines, start), len(self._newlines)):
+            self._newlines[i] += delta
+    
+    def _emit(self, data: bytes) -> None:
+        """Queue terminal output until the next flush."""
+        self._out += data
+    
+    def _flush(self) -> None:
+        """Write all queued terminal output at once."""
+        if self._out:
+            data = bytes(self._out)
+            self._out.clear()
+            # Straight to the fd: no file object, encoder or buffer in between
+            while data:
+                data = data[os.write(self._stdout_fd, data):]
     
     def _move_cursor(self, row: int, col: int) -> None:
-        """Move cursor to specific position."""
-        print(f"\033[{row + 1};{col + 1}H", end='', flush=True)
+        """Move cursor to specific position with the shortest escape sequence."""
+        at = self._at
+        if at == (row, col):
+            return
+        
+        if at is not None and at[0] == row:
+            # Same line: a relative move is shorter than an absolute one
+            delta = col - at[1]
+            if 0 < delta < len(CURSOR_FORWARD_STEPS):
+                self._emit(CURSOR_FORWARD_STEPS[delta])
+            elif 0 < -delta < len(CURSOR_BACK_STEPS):
+                self._emit(CURSOR_BACK_STEPS[-delta])
+            elif delta > 0:
+                self._emit(CURSOR_FORWARD % delta)
+            else:
+                self._emit(CURSOR_BACK % -delta)
+        else:
+            seq = self._moves.get((row, col))
+            if seq is None:
+                seq = self._moves[(row, col)] = CURSOR_MOVE % (row + 1, col + 1)
+            self._emit(seq)
+        self._at = (row, col)
     
     def _clear_line(self) -> None:
         """Clear current line."""
-        print("\033[K", end='', flush=True)
+        self._emit(CLEAR_LINE)
+    
+    def _read_keys(self, fd: int) -> List[Union[str, bytes]]:
+        """Read a burst of input and split it into key names and raw text runs."""
+        buf = os.read(fd, 64)
+        deadline = time.monotonic() + INPUT_BURST_WINDOW
+        while time.monotonic() < deadline and select.select([fd], [], [], 0)[0]:
+            chunk = os.read(fd, 64)
+            if not chunk:
+                break
+            buf += chunk
+        
+        if buf.endswith(b'\x1b') and select.select([fd], [], [], 0.005)[0]:
+            # The rest of an escape sequence arrived a little late
+            buf += os.read(fd, 8)
+        
+        keys = []
+        for token in KEY_TOKEN_RE.findall(buf):
+            name = KEY_SEQUENCES.get(token)
+            if name:
+                keys.append(name)
+            elif token[0] >= 0x20:
+                keys.append(token)
+        return keys
     
-    def _get_char(self) -> str:
-        """Get a single character from stdin."""
+    def edit(self, start_row: int, start_col: int) -> str:
+        """Edit text in-place starting at the given position."""
         if 'pytest' in sys.modules or not sys.stdin.isatty():
             raise Exception("Not in interactive terminal")
-            
-        try:
-            import tty
-            import termios
-        except ImportError:
+        if termios is None:
             raise Exception("tty/termios not available")
-            
+        
+        self.editing = True
+        
+        # Switch to raw mode once for the whole session, not per character
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
             tty.setraw(fd)
-            ch = sys.stdin.read(1)
-            return ch
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    
-    def _get_special_key(self) -> Optional[str]:
-        """Get special keys like arrow keys."""
-        ch = self._get_char()
-        if ch == '\x1b':  # ESC
-            next_ch = self._get_char()
-            if next_ch == '[':
-                third_ch = self._get_char()
-                if third_ch == 'D':  # Left arrow
-                    return 'LEFT'
-                elif third_ch == 'C':  # Right arrow
-                    return 'RIGHT'
-                elif third_ch == 'H':  # Home
-                    return 'HOME'
-                elif third_ch == 'F':  # End
-                    return 'END'
-        elif ch == '\x7f':  # Backspace
-            return 'BACKSPACE'
-        elif ch == '\x04':  # Ctrl+D
-            return 'CTRL_D'
-        elif ch == '\x0d':  # Enter
-            return 'ENTER'
-        return ch
-    
-    def edit(self, start_row: int, start_col: int) -> str:
-        """Edit text in-place starting at the given position."""
-        self.editing = True
-        
-        # Move cursor to start position
-        self._move_cursor(start_row, start_col)
-        
-        # Display initial text
-        print(self.text, end='', flush=True)
-        
-        while self.editing:
-            key = self._get_special_key()
-            
-            if key == 'LEFT':
-                if self.cursor_pos > 0:
-                    self.cursor_pos -= 1
-                    row, col = self._get_cursor_position(self.text, self.cursor_pos)
-                    self._move_cursor(start_row + row, start_col + col)
-            
-            elif key == 'RIGHT':
-                if self.cursor_pos < len(self.text):
-                    self.cursor_pos += 1
-                    row, col = self._get_cursor_position(self.text, self.cursor_pos)
-                    self._move_cursor(start_row + row, start_col + col)
-            
-            elif key == 'HOME':
-                self.cursor_pos = 0
-                self._move_cursor(start_row, start_col)
-            
-            elif key == 'END':
-                self.cursor_pos = len(self.text)
-                row, col = self._get_cursor_position(self.text, self.cursor_pos)
-                self._move_cursor(start_row + row, start_col + col)
-            
-            elif key == 'BACKSPACE':
-                if self.cursor_pos > 0:
-                    self.text = self.text[:self.cursor_pos - 1] + self.text[self.cursor_pos:]
-                    self.cursor_pos -= 1
-                    # Redraw from cursor position
-                    row, col = self._get_cursor_position(self.text, self.cursor_pos)
-                    self._move_cursor(start_row + row, start_col + col)
-                    self._clear_line()
-                    print(self.text[self.cursor_pos:], end='', flush=True)
-                    self._move_cursor(start_row + row, start_col + col)
+            # Move cursor to start position
+            self._move_cursor(start_row, start_col)
             
-            elif key == 'ENTER':
-                self.editing = False
-                break
+            # Display initial text
+            # Anything rich left in the text layer must reach the screen first
+            sys.stdout.flush()
+            self._stdout_fd = sys.stdout.fileno()
+            self._emit(self.text.encode('utf-8'))
+            self._flush()
+            # Raw mode does not return the carriage on newlines, so after
+            # multi-line text the terminal cursor position is unknown
+            self._at = None if self._newlines else (start_row, start_col + self.cursor_col)
             
-            elif key == 'CTRL_D':
-                self.editing = False
-                self.text = ""
-                break
+            while self.editing:
+                # Apply every key from the burst, then redraw once
+                for key in self._read_keys(fd):
+                    if key == 'LEFT':
+                        if self._left:
+                            ch = self._left.pop()
+                            self._right.append(ch)
+                            if ch == '\n':
+                                self.cursor_row -= 1
+                                self.cursor_col = self._line_column()
+                            else:
+                                self.cursor_col -= 1
+                            self._move_cursor(start_row + self.cursor_row, start_col + self.cursor_col)
+                    
+                    elif key == 'RIGHT':
+                        if self._right:
+                            ch = self._right.pop()
+                            self._left.append(ch)
+                            if ch == '\n':
+                                self.cursor_row += 1
+                                self.cursor_col = 0
+                            else:
+                                self.cursor_col += 1
+                            self._move_cursor(start_row + self.cursor_row, start_col + self.cursor_col)
+                    
+                    elif key == 'HOME':
+                        self._right.extend(reversed(self._left))
+                        self._left.clear()
+                        self.cursor_row = 0
+                        self.cursor_col = 0
+                        self._move_cursor(start_row, start_col)
+                    
+                    elif key == 'END':
+                        self.cursor_row += self._right.count('\n')
+                        self._left.extend(reversed(self._right))
+                        self._right.clear()
+                        self.cursor_col = self._line_column()
+                        self._move_cursor(start_row + self.cursor_row, start_col + self.cursor_col)
+                    
+                    elif key == 'BACKSPACE':
+                        if self._left:
+                            removed = self._left.pop()
+                            pos = len(self._left)
+                            if removed == '\n':
+                                self._newlines.remove(pos)
+                            self._shift_newlines(pos, -1)
+                            if removed == '\n':
+                                self.cursor_row -= 1
+                                self.cursor_col = self._line_column()
+                                # Lines were joined, so redraw everything after the cursor
+                                self._move_cursor(start_row + self.cursor_row, start_col + self.cursor_col)
+                                self._clear_line()
+                                self._emit(''.join(reversed(self._right)).encode('utf-8'))
+                                self._at = None
+                                self._move_cursor(start_row + self.cursor_row, start_col + self.cursor_col)
+                            else:
+                                self.cursor_col -= 1
+                                # Step back and let the terminal delete the character
+                                self._emit(DELETE_BACK)
+                    
+                    elif key == 'ENTER':
+                        self.editing = False
+                        break
+                    
+                    elif key == 'CTRL_D':
+                        self.editing = False
+                        self.text = ""
+                        break
+                    
+                    elif isinstance(key, bytes):
+                        # Decode a text run once and drop only control characters,
+                        # so one odd character cannot discard a whole paste
+                        chars = "".join(c for c in key.decode('utf-8', 'ignore') if c >= " ")
+                        if chars:
+                            self._shift_newlines(len(self._left), len(chars))
+                            self._left.extend(chars)
+                            self.cursor_col += len(chars)
+                            echo = chars.encode('utf-8')
+                            if not self._right:
+                                # Appending: nothing after the cursor needs to move
+                                self._emit(echo)
+                            else:
+                                # Open a gap with insert-character, then fill it
+                                self._emit(INSERT_BLANKS % len(chars) + echo)
+                    
+                    # Every edit above leaves the terminal cursor on the logical one
+                    self._at = (start_row + self.cursor_row, start_col + self.cursor_col)
+                
+                self._flush()
             
-            elif isinstance(key, str) and len(key) == 1 and ord(key) >= 32:
-                # Insert character
-                self.text = self.text[:self.cursor_pos] + key + self.text[self.cursor_pos:]
-                self.cursor_pos += 1
-                # Redraw from cursor position
-                row, col = self._get_cursor_position(self.text, self.cursor_pos - 1)
-                self._move_cursor(start_row + row, start_col + col - 1)
-                self._clear_line()
-                print(self.text[self.cursor_pos - 1:], end='', flush=True)
-                self._move_cursor(start_row + row, start_col + col)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         
         return self.text
 
@@ -173,110 +331,47 @@ class UnifiedKeyboardHandler:
         """Initialize keyboard handler with valid keys."""
         self.valid_keys = valid_keys or {'a', 'c', 'q'}
         self.running = True
-        self._listener_thread = None
     
-    def start_listening(self, callback: Callable[[str], None]) -> None:
-        """Start listening for keyboard input."""
+    def listen(self, callback: Callable[[str], None]) -> None:
+        """Block on keyboard input and dispatch valid keys until stopped."""
         if not sys.stdin.isatty() or 'pytest' in sys.modules:
-            self._start_fallback_listener(callback)
-            return
-        
-        # Try the best method first, fall back to alternatives
-        if self._try_keyboard_library(callback):
-            return
-        elif self._try_platform_specific(callback):
-            return
+            self._fallback_loop(callback)
         else:
-            self._start_fallback_listener(callback)
-    
-    def _try_keyboard_library(self, callback: Callable[[str], None]) -> bool:
-        """Try using the keyboard library."""
-        try:
-            import keyboard
-            
-            def on_key_press(event):
-                if not self.running:
-                    return
-                if event.name in self.valid_keys:
-                    callback(event.name)
-            
-            keyboard.on_press(on_key_press)
-            
-            self._listener_thread = threading.Thread(
-                target=self._keyboard_library_loop, 
-                daemon=True
-            )
-            self._listener_thread.start()
-            return True
-            
-        except (ImportError, PermissionError, OSError):
-            return False
-    
-    def _keyboard_library_loop(self) -> None:
-        """Main loop for keyboard library listener."""
-        try:
-            while self.running:
-                time.sleep(0.1)
-        except Exception:
-            pass
-    
-    def _try_platform_specific(self, callback: Callable[[str], None]) -> bool:
-        """Try platform-specific keyboard input."""
-        try:
-            self._listener_thread = threading.Thread(
-                target=self._platform_specific_loop, 
-                args=(callback,),
-                daemon=True
-            )
-            self._listener_thread.start()
-            return True
-        except Exception:
-            return False
+            self._platform_specific_loop(callback)
     
     def _platform_specific_loop(self, callback: Callable[[str], None]) -> None:
         """Platform-specific keyboard input loop."""
-        try:
+        if msvcrt is not None:  # Windows
             while self.running:
-                key = self._get_single_key()
-                if key and key in self.valid_keys:
+                key = msvcrt.getwch().lower()
+                if key in self.valid_keys:
                     callback(key)
-                time.sleep(0.01)
-        except Exception:
-            pass
-    
-    def _get_single_key(self) -> Optional[str]:
-        """Get a single key press without requiring Enter."""
+            return
+        
+        # Unix-like systems: set cbreak once and sleep in the selector until a
+        # key arrives, instead of polling and toggling the tty per character
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
         try:
-            if os.name == 'nt':  # Windows
-                import msvcrt
-                key = msvcrt.getch().decode('utf-8').lower()
-                return key if key in self.valid_keys else None
-            else:  # Unix-like systems
-                try:
-                    import tty
-                    import termios
-                except ImportError:
-                    return None
+            tty.setcbreak(fd)
+            while self.running:
+                if not selector.select():
+                    continue
                 
-                fd = sys.stdin.fileno()
-                old_settings = termios.tcgetattr(fd)
-                try:
-                    tty.setraw(sys.stdin.fileno())
-                    ch = sys.stdin.read(1).lower()
-                    return ch if ch in self.valid_keys else None
-                finally:
-                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        except Exception:
-            return None
-    
-    def _start_fallback_listener(self, callback: Callable[[str], None]) -> None:
-        """Start fallback listener using traditional input."""
-        self._listener_thread = threading.Thread(
-            target=self._fallback_loop, 
-            args=(callback,),
-            daemon=True
-        )
-        self._listener_thread.start()
+                data = os.read(fd, 64)
+                if not data:  # EOF
+                    break
+                
+                for key in data.decode('utf-8', 'ignore').lower():
+                    if key in self.valid_keys:
+                        callback(key)
+                    if not self.running:
+                        break
+        finally:
+            selector.close()
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     
     def _fallback_loop(self, callback: Callable[[str], None]) -> None:
         """Fallback input loop using traditional input."""
@@ -296,8 +391,6 @@ class UnifiedKeyboardHandler:
     def stop(self) -> None:
         """Stop the keyboard listener."""
         self.running = False
-        if self._listener_thread and self._listener_thread.is_alive():
-            self._listener_thread.join(timeout=1.0)
 
 
 class SimpleCommitTUI:
@@ -310,62 +403,90 @@ class SimpleCommitTUI:
         self.git_wrapper = git_wrapper
         self.console = Console()
         self.running = True
-        self.keyboard_handler = UnifiedKeyboardHandler({'a', 'c', 'q'})
+        # Keys arrive lowercased from the reader, so dispatch is a plain lookup
+        self._key_actions: Dict[str, Callable[[], None]] = {
+            'a': self._handle_accept,
+            'c': self._handle_copy,
+            'q': self._handle_quit,
+        }
+        self.keyboard_handler = UnifiedKeyboardHandler(set(self._key_actions))
+        
+        # The analysis is fixed for the TUI's lifetime, so parse its info lines once
+        self._info_lines = [
+            Text.from_markup(f"[yellow]Branch:[/yellow] [white]{analysis.branch_name}[/white]"),
+            Text.from_markup(f"[yellow]Files:[/yellow] [white]{len(analysis.staged_files)}[/white]"),
+            Text.from_markup(f"[yellow]Changes:[/yellow] [white]{analysis.change_summary}[/white]"),
+            EMPTY_TEXT
+        ]
+        
+        # Readiness is fetched once per run; the last panel is kept with its inputs
+        self._readiness: Optional[Dict[str, Any]] = None
+        self._panel_key: Optional[Tuple[str, bool]] = None
+        self._panel: Optional[Panel] = None
     
     def _clear_terminal(self) -> None:
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Write the clear/home escape codes directly instead of spawning a shell
+        self.console.clear()
+    
+    def _get_readiness(self) -> Dict[str, Any]:
+        """Get commit readiness, querying git only on first use."""
+        if self._readiness is None:
+            self._readiness = self.git_wrapper.check_commit_readiness()
+        return self._readiness
     
     def _get_main_panel(self) -> Panel:
         """Create the main panel that shows the edit interface directly."""
+        unstaged_changes = bool(self._get_readiness()["unstaged_changes"])
+        cache_key = (self.message, unstaged_changes)
+        if cache_key == self._panel_key:
+            return self._panel
+        
         message_panel = Panel(
-            f"[bold yellow]✎[/bold yellow] {self.message}",
-            title="[bold yellow]✎ Edit commit message[/bold yellow]",
+            Text.assemble(MESSAGE_PREFIX, self.message),
+            title=MESSAGE_PANEL_TITLE,
             border_style="yellow",
             padding=(1, 2)
         )
         
-        info_lines = [
-            f"[yellow]Branch:[/yellow] [white]{self.analysis.branch_name}[/white]",
-            f"[yellow]Files:[/yellow] [white]{len(self.analysis.staged_files)}[/white]",
-            f"[yellow]Changes:[/yellow] [white]{self.analysis.change_summary}[/white]",
-            ""
-        ]
-        
-        readiness = self.git_wrapper.check_commit_readiness()
-        if readiness["unstaged_changes"]:
-            info_lines.append(f"[yellow]⚠️  You also have unstaged changes. Only staged changes will be committed.[/yellow]")
+        info_lines = list(self._info_lines)
         
-        info_lines.append("")
+        if unstaged_changes:
+            info_lines.append(UNSTAGED_WARNING_TEXT)
         
-        info_group = Group(*(Text.from_markup(line) for line in info_lines))
+        info_lines.append(EMPTY_TEXT)
         
-        actions_text = "[dim]Press Enter to finish editing, a to accept, c to copy, q to quit[/dim]"
+        info_group = Group(*info_lines)
         
         group = Group(
             message_panel,
             info_group,
-            Text.from_markup(actions_text),
-            Text("")
+            ACTIONS_TEXT,
+            EMPTY_TEXT
         )
-        return Panel(
+        panel = Panel(
             group,
-            title="[bold blue]🚀 lazygit-ai - Commit Message Editor[/bold blue]",
+            title=MAIN_PANEL_TITLE,
             border_style="blue",
             padding=(1, 2),
             expand=True
         )
+        self._panel_key = cache_key
+        self._panel = panel
+        return panel
+    
+    def _redraw(self, *status_lines: str) -> None:
+        """Clear the screen and print the main panel plus status lines in one call."""
+        self._clear_terminal()
+        renderables = [self._get_main_panel()]
+        renderables.extend(Text.from_markup(line) for line in status_lines)
+        self.console.print(Group(*renderables))
     
     def _handle_key_press(self, key: str) -> None:
         """Handle key press events."""
-        key = key.lower()
-        
-        if key == "a":
-            self._handle_accept()
-        elif key == "c":
-            self._handle_copy()
-        elif key == "q":
-            self._handle_quit()
+        action = self._key_actions.get(key)
+        if action is not None:
+            action()
     
     def _handle_accept(self) -> None:
         """Handle accept action."""
@@ -380,11 +501,33 @@ class SimpleCommitTUI:
     
     def _handle_copy(self) -> None:
         """Handle copy action."""
+        # Over SSH pyperclip would reach the remote host's clipboard (if any),
+        # so hand the text to the local terminal with OSC 52 instead
+        if os.environ.get("SSH_TTY") and self._copy_via_terminal():
+            self.console.print("[bold green]📋 Message sent to terminal clipboard![/bold green]")
+            return
+        
         try:
+            # Imported on demand: pyperclip probes for clipboard tools at import
+            import pyperclip
             pyperclip.copy(self.message)
             self.console.print("[bold green]📋 Message copied to clipboard![/bold green]")
         except Exception as e:
-            self.console.print(f"[bold red]❌ Failed to copy to clipboard: {e}[/bold red]")
+            if self._copy_via_terminal():
+                self.console.print("[bold green]📋 Message sent to terminal clipboard![/bold green]")
+            else:
+                self.console.print(f"[bold red]❌ Failed to copy to clipboard: {e}[/bold red]")
+    
+    def _copy_via_terminal(self) -> bool:
+        """Copy the message with an OSC 52 escape; needs stdout to be a terminal."""
+        if not sys.stdout.isatty():
+            return False
+        
+        payload = base64.b64encode(self.message.encode('utf-8'))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(OSC52_COPY % payload)
+        sys.stdout.buffer.flush()
+        return True
     
     def _handle_quit(self) -> None:
         """Handle quit action."""
@@ -395,33 +538,63 @@ class SimpleCommitTUI:
     
     def run(self) -> None:
         """Run the simple TUI with direct edit mode."""
-        readiness = self.git_wrapper.check_commit_readiness()
+        # Fetched once here; every later redraw reuses the cached result
+        readiness = self._get_readiness()
         
         if not readiness["ready"]:
             self._clear_terminal()
-            self.console.print(f"[bold red]{readiness['message']}[/bold red]")
-            self.console.print("\n[yellow]Please stage your files first, then run lazygit-ai again.[/yellow]")
+            self.console.print(
+                f"[bold red]{readiness['message']}[/bold red]\n"
+                "\n[yellow]Please stage your files first, then run lazygit-ai again.[/yellow]"
+            )
             self.running = False
             sys.exit(1)
         
-        self._clear_terminal()
-        self.console.print(self._get_main_panel())
-        
-        self._handle_edit()
-        
-        self._clear_terminal()
-        self.console.print(self._get_main_panel())
-        
-        # Start unified keyboard handler
-        self.keyboard_handler.start_listening(self._handle_key_press)
-        
+        # Handlers leave via sys.exit, so restore the terminal on the way out
+        saved_settings = self._save_terminal()
         try:
-            while self.running:
-                time.sleep(0.1)
-        except KeyboardInterrupt:
-            self._handle_quit()
+            # Hide the cursor once for the session instead of letting it
+            # flicker across each redraw; it is only shown while editing
+            self._set_cursor_visible(False)
+            self._redraw()
+            
+            # _handle_edit repaints the panel once the edit is finished
+            self._set_cursor_visible(True)
+            self._handle_edit()
+            self._set_cursor_visible(False)
+            
+            # Single event loop: block on key presses and dispatch them here
+            try:
+                self.keyboard_handler.listen(self._handle_key_press)
+            except KeyboardInterrupt:
+                self._handle_quit()
         finally:
             self.keyboard_handler.stop()
+            self._restore_terminal(saved_settings)
+    
+    def _save_terminal(self) -> Optional[list]:
+        """Snapshot the terminal attributes, if stdin is a terminal."""
+        if termios is None or not sys.stdin.isatty():
+            return None
+        return termios.tcgetattr(sys.stdin.fileno())
+    
+    def _restore_terminal(self, saved_settings: Optional[list]) -> None:
+        """Restore terminal attributes and make sure the cursor is visible."""
+        if saved_settings is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, saved_settings)
+        self._set_cursor_visible(True)
+    
+    def _set_cursor_visible(self, visible: bool) -> None:
+        """Show or hide the terminal cursor."""
+        self._write_control(SHOW_CURSOR if visible else HIDE_CURSOR)
+    
+    def _write_control(self, sequence: bytes) -> None:
+        """Write a raw control sequence when stdout is a terminal."""
+        if not sys.stdout.isatty():
+            return
+        sys.stdout.flush()
+        sys.stdout.buffer.write(sequence)
+        sys.stdout.buffer.flush()
     
     def _handle_edit(self) -> None:
         """Handle edit action with in-place editing."""
@@ -439,13 +612,17 @@ class SimpleCommitTUI:
             
             editor = InPlaceEditor(self.message)
             
+            # Remember the spot below the panel so an unchanged edit can return there
+            self._write_control(SAVE_CURSOR)
             new_message = editor.edit(cursor_row, cursor_col)
             
-            if new_message.strip():
-                self.message = new_message.strip()
-                self._clear_terminal()
-                self.console.print(self._get_main_panel())
-                self.console.print("[bold green]✅ Message updated![/bold green]")
+            if new_message == self.message:
+                # The panel already shows the message, so just leave it
+                self._write_control(RESTORE_CURSOR)
+            elif not self._apply_edit(new_message):
+                # Ctrl-D, an emptied line or stripped whitespace left the
+                # panel showing something other than the kept message
+                self._redraw()
             
         except Exception as e:
             self._fallback_edit()
@@ -455,36 +632,33 @@ class SimpleCommitTUI:
         try:
             self.console.print(f"\n[bold cyan]✎ Editing commit message:[/bold cyan]")
             
-            import readline
-            
-            readline.set_startup_hook(lambda: readline.insert_text(self.message))
-            
-            new_message = input("[bold yellow]Message: [/bold yellow]")
-            
-            readline.set_startup_hook()
+            # Pre-fill the line with the current message when readline is available;
+            # without it an empty answer keeps the message unchanged
+            if readline is not None:
+                readline.set_startup_hook(lambda: readline.insert_text(self.message))
+            try:
+                new_message = self.console.input("[bold yellow]Message: [/bold yellow]")
+            finally:
+                if readline is not None:
+                    readline.set_startup_hook()
             
-            if new_message.strip():
-                self.message = new_message.strip()
-                self._clear_terminal()
-                self.console.print(self._get_main_panel())
-                self.console.print("[bold green]✅ Message updated![/bold green]")
+            # The prompt sits below the panel, so a kept message needs no repaint
+            self._apply_edit(new_message)
             
-        except ImportError:
-            self.console.print(f"\n[bold cyan]✎ Editing commit message:[/bold cyan]")
-            new_message = Prompt.ask(
-                "[bold yellow]Message[/bold yellow]",
-                default=self.message,
-                show_default=False
-            )
-            if new_message.strip():
-                self.message = new_message.strip()
-                self._clear_terminal()
-                self.console.print(self._get_main_panel())
-                self.console.print("[bold green]✅ Message updated![/bold green]")
         except KeyboardInterrupt:
-            pass
+            self._redraw()
         except EOFError:
-            pass
+            self._redraw()
+    
+    def _apply_edit(self, new_message: str) -> bool:
+        """Store an edited message and redraw, unless it is empty or unchanged."""
+        new_message = new_message.strip()
+        if not new_message or new_message == self.message:
+            return False
+        
+        self.message = new_message
+        self._redraw("[bold green]✅ Message updated![/bold green]")
+        return True
 
 
 class CommitTUI(SimpleCommitTUI):
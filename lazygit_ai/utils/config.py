@@ -4,23 +4,73 @@ Configuration management for lazygit-ai.
 Handles user preferences, AI provider settings, and commit message formatting.
 """
 
+import copy
 import os
+import pickle
+import shutil
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import toml
-from rich.console import Console
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 class ConfigManager:
     """Manages lazygit-ai configuration."""
     
+    # Built once; callers get a deep copy so the template is never mutated
+    DEFAULT_CONFIG: Dict[str, Any] = {
+        "ai": {
+            "provider": "none",  # openai, anthropic, ollama, none
+            "model": "gpt-4",    # Model name for the provider
+            "temperature": 0.3,  # Creativity level (0.0-1.0)
+            "max_tokens": 150,   # Maximum tokens for AI response
+            "timeout": 30,       # Timeout in seconds
+        },
+        "commit": {
+            "conventional": True,     # Use conventional commit format
+            "max_length": 72,        # Maximum commit message length
+            "scope_style": "lowercase",  # lowercase, kebab-case, camelCase
+            "include_scope": True,   # Include scope in commit messages
+            "auto_scope": True,      # Auto-detect scope from files/branch
+        },
+        "rules": {
+            "enable_todos": True,     # Parse TODO comments
+            "enable_fixes": True,     # Parse FIX comments
+            "enable_bugs": True,      # Parse BUG comments
+            "branch_analysis": True,  # Use branch name for context
+            "file_type_analysis": True,  # Analyze file types
+            "diff_analysis": True,    # Analyze git diff patterns
+        },
+        "ui": {
+            "show_banner": True,      # Show ASCII banner
+            "colors": True,           # Enable colored output
+            "interactive": True,      # Use interactive TUI
+            "copy_to_clipboard": True,  # Copy commit message to clipboard
+        },
+        "lazygit": {
+            "auto_install": True,     # Auto-install shortcuts
+            "default_key": "C",       # Default key binding
+            "default_context": "files",  # Default context
+        },
+    }
+    
     def __init__(self) -> None:
         """Initialize configuration manager."""
         self.config_dir = Path.home() / ".config" / "lazygit-ai"
         self.config_file = self.config_dir / "config.toml"
+        self.cache_file = self.config_dir / "config.cache.pkl"
         self._config: Optional[Dict[str, Any]] = None
+        # Every dotted key mapped to its value, rebuilt whenever the config changes
+        self._flat: Dict[str, Any] = {}
+        # Per-invocation values from the environment, layered over the file but never saved
+        self._overrides: Dict[str, Any] = {}
         
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -32,71 +82,80 @@ class ConfigManager:
         """Load configuration from file or create default."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, "r") as f:
-                    self._config = toml.load(f)
+                stamp = self._config_stamp()
+                self._config = self._read_cache(stamp)
+                if self._config is None:
+                    with open(self.config_file, "rb") as f:
+                        self._config = tomllib.load(f)
+                    self._write_cache(stamp)
             except Exception:
                 self._config = self._get_default_config()
         else:
             self._config = self._get_default_config()
             self._save_config()
+        
+        self._rebuild_flat()
+    
+    def _rebuild_flat(self) -> None:
+        """Flatten the nested config into a dotted-key lookup table."""
+        flat: Dict[str, Any] = {}
+        
+        def walk(section: Dict[str, Any], prefix: str) -> None:
+            for name, value in section.items():
+                dotted = prefix + name
+                flat[dotted] = value
+                if isinstance(value, dict):
+                    walk(value, dotted + ".")
+        
+        walk(self._config, "")
+        flat.update(self._overrides)
+        self._flat = flat
     
     def _save_config(self) -> None:
         """Save configuration to file."""
+        # Only writes need the toml package; reads use tomllib
+        import toml
+        
         try:
             with open(self.config_file, "w") as f:
                 toml.dump(self._config, f)
         except Exception as e:
             raise RuntimeError(f"Failed to save configuration: {e}")
+        
+        self._write_cache(self._config_stamp())
+    
+    def _config_stamp(self) -> str:
+        """Identify the current config file contents by mtime and size."""
+        stat = self.config_file.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+    
+    def _read_cache(self, stamp: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parsed config if it matches the given stamp."""
+        try:
+            with open(self.cache_file, "rb") as f:
+                cached_stamp, config = pickle.load(f)
+        except Exception:
+            return None
+        return config if cached_stamp == stamp else None
+    
+    def _write_cache(self, stamp: str) -> None:
+        """Store the parsed config so unchanged files skip TOML parsing."""
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                pickle.dump((stamp, self._config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except Exception:
+            # The cache is only an optimisation; never fail because of it
+            pass
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration."""
-        return {
-            "ai": {
-                "provider": "none",  # openai, anthropic, ollama, none
-                "model": "gpt-4",    # Model name for the provider
-                "temperature": 0.3,  # Creativity level (0.0-1.0)
-                "max_tokens": 150,   # Maximum tokens for AI response
-                "timeout": 30,       # Timeout in seconds
-            },
-            "commit": {
-                "conventional": True,     # Use conventional commit format
-                "max_length": 72,        # Maximum commit message length
-                "scope_style": "lowercase",  # lowercase, kebab-case, camelCase
-                "include_scope": True,   # Include scope in commit messages
-                "auto_scope": True,      # Auto-detect scope from files/branch
-            },
-            "rules": {
-                "enable_todos": True,     # Parse TODO comments
-                "enable_fixes": True,     # Parse FIX comments
-                "enable_bugs": True,      # Parse BUG comments
-                "branch_analysis": True,  # Use branch name for context
-                "file_type_analysis": True,  # Analyze file types
-                "diff_analysis": True,    # Analyze git diff patterns
-            },
-            "ui": {
-                "show_banner": True,      # Show ASCII banner
-                "colors": True,           # Enable colored output
-                "interactive": True,      # Use interactive TUI
-                "copy_to_clipboard": True,  # Copy commit message to clipboard
-            },
-            "lazygit": {
-                "auto_install": True,     # Auto-install shortcuts
-                "default_key": "C",       # Default key binding
-                "default_context": "files",  # Default context
-            },
-        }
+        return copy.deepcopy(self.DEFAULT_CONFIG)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
-        keys = key.split(".")
-        value = self._config
-        
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value using dot notation."""
@@ -109,8 +168,15 @@ class ConfigManager:
                 config[k] = {}
             config = config[k]
         
+        # Nothing to write when the value is already set (type-checked so 1 does not match True)
+        if keys[-1] in config:
+            current = config[keys[-1]]
+            if type(current) is type(value) and current == value:
+                return
+        
         # Set the value
         config[keys[-1]] = value
+        self._rebuild_flat()
         self._save_config()
     
     def ai_enabled(self) -> bool:
@@ -166,62 +232,56 @@ class ConfigManager:
             "default_context": self.get("lazygit.default_context", "files"),
         }
     
-    def show_config(self, console: Console) -> None:
+    def show_config(self, console: "Console") -> None:
         """Display current configuration."""
-        console.print("[blue]📋 Current Configuration[/blue]")
-        console.print()
-        
-        # AI Configuration
         ai_config = self.get_ai_config()
-        console.print("[bold]🤖 AI Settings:[/bold]")
-        console.print(f"  Provider: {ai_config['provider']}")
-        console.print(f"  Model: {ai_config['model']}")
-        console.print(f"  Temperature: {ai_config['temperature']}")
-        console.print(f"  Max Tokens: {ai_config['max_tokens']}")
-        console.print(f"  Timeout: {ai_config['timeout']}s")
-        console.print()
-        
-        # Commit Configuration
         commit_config = self.get_commit_config()
-        console.print("[bold]📝 Commit Settings:[/bold]")
-        console.print(f"  Conventional: {commit_config['conventional']}")
-        console.print(f"  Max Length: {commit_config['max_length']}")
-        console.print(f"  Scope Style: {commit_config['scope_style']}")
-        console.print(f"  Include Scope: {commit_config['include_scope']}")
-        console.print(f"  Auto Scope: {commit_config['auto_scope']}")
-        console.print()
-        
-        # Rules Configuration
         rules_config = self.get_rules_config()
-        console.print("[bold]🔍 Rules Settings:[/bold]")
-        console.print(f"  Enable TODOs: {rules_config['enable_todos']}")
-        console.print(f"  Enable Fixes: {rules_config['enable_fixes']}")
-        console.print(f"  Enable Bugs: {rules_config['enable_bugs']}")
-        console.print(f"  Branch Analysis: {rules_config['branch_analysis']}")
-        console.print(f"  File Type Analysis: {rules_config['file_type_analysis']}")
-        console.print(f"  Diff Analysis: {rules_config['diff_analysis']}")
-        console.print()
-        
-        # UI Configuration
         ui_config = self.get_ui_config()
-        console.print("[bold]🖥️  UI Settings:[/bold]")
-        console.print(f"  Show Banner: {ui_config['show_banner']}")
-        console.print(f"  Colors: {ui_config['colors']}")
-        console.print(f"  Interactive: {ui_config['interactive']}")
-        console.print(f"  Copy to Clipboard: {ui_config['copy_to_clipboard']}")
-        console.print()
-        
-        # LazyGit Configuration
         lazygit_config = self.get_lazygit_config()
-        console.print("[bold]🎯 LazyGit Settings:[/bold]")
-        console.print(f"  Auto Install: {lazygit_config['auto_install']}")
-        console.print(f"  Default Key: {lazygit_config['default_key']}")
-        console.print(f"  Default Context: {lazygit_config['default_context']}")
-        console.print()
         
-        console.print(f"[dim]Config file: {self.config_file}[/dim]")
+        # Build the whole block first so Rich renders and flushes it once
+        lines = [
+            "[blue]📋 Current Configuration[/blue]",
+            "",
+            "[bold]🤖 AI Settings:[/bold]",
+            f"  Provider: {ai_config['provider']}",
+            f"  Model: {ai_config['model']}",
+            f"  Temperature: {ai_config['temperature']}",
+            f"  Max Tokens: {ai_config['max_tokens']}",
+            f"  Timeout: {ai_config['timeout']}s",
+            "",
+            "[bold]📝 Commit Settings:[/bold]",
+            f"  Conventional: {commit_config['conventional']}",
+            f"  Max Length: {commit_config['max_length']}",
+            f"  Scope Style: {commit_config['scope_style']}",
+            f"  Include Scope: {commit_config['include_scope']}",
+            f"  Auto Scope: {commit_config['auto_scope']}",
+            "",
+            "[bold]🔍 Rules Settings:[/bold]",
+            f"  Enable TODOs: {rules_config['enable_todos']}",
+            f"  Enable Fixes: {rules_config['enable_fixes']}",
+            f"  Enable Bugs: {rules_config['enable_bugs']}",
+            f"  Branch Analysis: {rules_config['branch_analysis']}",
+            f"  File Type Analysis: {rules_config['file_type_analysis']}",
+            f"  Diff Analysis: {rules_config['diff_analysis']}",
+            "",
+            "[bold]🖥️  UI Settings:[/bold]",
+            f"  Show Banner: {ui_config['show_banner']}",
+            f"  Colors: {ui_config['colors']}",
+            f"  Interactive: {ui_config['interactive']}",
+            f"  Copy to Clipboard: {ui_config['copy_to_clipboard']}",
+            "",
+            "[bold]🎯 LazyGit Settings:[/bold]",
+            f"  Auto Install: {lazygit_config['auto_install']}",
+            f"  Default Key: {lazygit_config['default_key']}",
+            f"  Default Context: {lazygit_config['default_context']}",
+            "",
+            f"[dim]Config file: {self.config_file}[/dim]",
+        ]
+        console.print("\n".join(lines))
     
-    def edit_config(self, console: Console) -> None:
+    def edit_config(self, console: "Console") -> None:
         """Open configuration file in default editor."""
         console.print(f"[blue]📝 Opening config file in editor...[/blue]")
         console.print(f"File: {self.config_file}")
@@ -230,14 +290,8 @@ class ConfigManager:
         # Try to open with default editor
         editor = os.environ.get("EDITOR")
         if not editor:
-            # Try common editors
-            for ed in ["nano", "vim", "code", "notepad"]:
-                try:
-                    subprocess.run([ed, "--version"], capture_output=True, check=True)
-                    editor = ed
-                    break
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
+            # Try common editors, found by a PATH lookup rather than launching each one
+            editor = next((ed for ed in ("nano", "vim", "code", "notepad") if shutil.which(ed)), None)
         
         if editor:
             try:
@@ -251,7 +305,7 @@ class ConfigManager:
             console.print("[yellow]⚠️  No editor found[/yellow]")
             console.print(f"[dim]Please manually edit: {self.config_file}[/dim]")
     
-    def reset_config(self, console: Console) -> None:
+    def reset_config(self, console: "Console") -> None:
         """Reset configuration to defaults."""
         console.print("[yellow]⚠️  This will reset all configuration to defaults![/yellow]")
         console.print("Are you sure? (y/N): ", end="")
@@ -260,6 +314,7 @@ class ConfigManager:
             response = input().strip().lower()
             if response in ["y", "yes"]:
                 self._config = self._get_default_config()
+                self._rebuild_flat()
                 self._save_config()
                 console.print("[green]✅ Configuration reset to defaults![/green]")
             else:
@@ -317,8 +372,9 @@ class ConfigManager:
             except ValueError:
                 pass
         
-        # Apply overrides
-        for key, value in overrides.items():
-            self.set(key, value)
+        # Apply overrides in memory only; they must not end up in config.toml
+        if overrides:
+            self._overrides.update(overrides)
+            self._rebuild_flat()
         
         return overrides 
\ No newline at end of file
@@ -5,12 +5,43 @@ Provides a clean interface for Git operations including diff analysis,
 branch information, and staged file management.
 """
 
+import functools
+import inspect
+import os
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import git
-from git import Repo
+# File category for each known suffix, checked in a single dict lookup
+SUFFIX_CATEGORIES = {
+    **dict.fromkeys((".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".c", ".cpp", ".h", ".hpp", ".go", ".rs", ".php", ".rb", ".swift", ".kt", ".scala"), "code"),
+    **dict.fromkeys((".md", ".txt", ".rst", ".adoc", ".tex"), "docs"),
+    **dict.fromkeys((".json", ".yaml", ".yml", ".toml", ".ini", ".cfg", ".conf", ".env"), "config"),
+    **dict.fromkeys((".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico", ".css", ".scss", ".sass", ".less"), "assets"),
+}
+
+# Test file naming conventions that a single suffix cannot express
+TEST_NAME_SUFFIXES = (".test.js", ".test.ts", ".spec.js", ".spec.ts", "_test.py")
+TEST_NAME_PREFIX = "test_"
+
+
+def _memo(method):
+    """Cache a read-only query on the instance until the next commit."""
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Bind with defaults so f(), f(5) and f(count=5) share one entry
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(bound.arguments.values())[1:]
+        try:
+            result = self._cache[key]
+        except KeyError:
+            result = self._cache[key] = method(self, *args, **kwargs)
+        # Hand out copies of lists so callers cannot corrupt the cache
+        return list(result) if isinstance(result, list) else result
+    return wrapper
 
 
 class GitWrapper:
@@ -24,60 +55,94 @@ class GitWrapper:
             repo_path: Path to git repository. If None, uses current directory.
         """
         self.repo_path = repo_path or Path.cwd()
-        self._repo: Optional[Repo] = None
-    
-    @property
-    def repo(self) -> Repo:
-        """Get GitPython Repo object, initializing if needed."""
-        if self._repo is None:
-            self._repo = Repo(self.repo_path)
-        return self._repo
+        self._cache: Dict[Tuple, Any] = {}
     
     def is_git_repo(self) -> bool:
         """Check if current directory is a git repository."""
         try:
-            return self.repo.git_dir is not None
-        except git.InvalidGitRepositoryError:
+            result = subprocess.run(
+                ["git", "rev-parse", "--is-inside-work-tree"],
+                capture_output=True,
+                cwd=self.repo_path,
+                check=False,
+            )
+            return result.returncode == 0
+        except FileNotFoundError:
             return False
     
+    @_memo
     def get_current_branch(self) -> str:
         """Get the name of the current branch."""
-        try:
-            return self.repo.active_branch.name
-        except (TypeError, AttributeError):
-            # Handle detached HEAD state
-            return self.repo.head.object.hexsha[:8]
+        # symbolic-ref also works on an unborn branch, unlike rev-parse
+        result = subprocess.run(
+            ["git", "symbolic-ref", "--short", "-q", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=self.repo_path,
+            check=False,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+        
+        # Handle detached HEAD state
+        result = subprocess.run(
+            ["git", "rev-parse", "--short=8", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=self.repo_path,
+            check=True,
+        )
+        return result.stdout.strip()
     
-    def get_staged_files(self) -> List[str]:
-        """Get list of staged files."""
+    @_memo
+    def _load_staged_once(self) -> Dict[str, Any]:
+        """Read staged paths and line counts from a single numstat call."""
+        files = []
+        insertions = deletions = 0
         try:
-            # Get staged files using git status
+            # Unmerged paths also show up as 0/0 entries but cannot be committed
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "diff", "--cached", "--numstat", "-z", "--diff-filter=ACDMRT"],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 check=True,
             )
             
-            staged_files = []
-            for line in result.stdout.split("\n"):
-                if line and len(line) >= 2:
-                    # Check if file is staged: first char is A/M/D/R (not space)
-                    # Second char can be anything (unstaged status)
-                    if line[0] in "AMDR":
-                        # Handle different prefix lengths:
-                        # "M README.md" -> prefix is 2 chars ("M ")
-                        # "M  README.md" -> prefix is 3 chars ("M  ")
-                        if len(line) >= 3 and line[1] == " " and line[2] == " ":
-                            file_path = line[3:].strip()  # Remove 3-char prefix
-                        else:
-                            file_path = line[2:].strip()  # Remove 2-char prefix
-                        staged_files.append(file_path)
-            
-            return staged_files
+            # Stay in bytes and decode only the paths that are kept
+            fields = result.stdout.split(b"\0")
+            i = 0
+            while i < len(fields):
+                record = fields[i]
+                i += 1
+                if not record:
+                    continue
+                
+                added, deleted, file_path = record.split(b"\t", 2)
+                if not file_path:
+                    # Renames leave the path empty and follow with old and new paths
+                    file_path = fields[i + 1]
+                    i += 2
+                files.append(file_path.decode("utf-8", "replace"))
+                
+                # Binary files report "-" instead of line counts
+                if added != b"-":
+                    insertions += int(added)
+                    deletions += int(deleted)
         except subprocess.CalledProcessError:
-            return []
+            pass
+        
+        return {
+            "files": files,
+            "stats": {
+                "files": len(files),
+                "insertions": insertions,
+                "deletions": deletions,
+            },
+        }
+    
+    def get_staged_files(self) -> List[str]:
+        """Get list of staged files."""
+        return list(self._load_staged_once()["files"])
     
     def get_staged_diff(self) -> str:
         """Get the diff of staged changes."""
@@ -85,25 +150,39 @@ class GitWrapper:
             result = subprocess.run(
                 ["git", "diff", "--cached", "--no-color"],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 check=True,
             )
-            return result.stdout
+            return result.stdout.decode("utf-8", "replace")
         except subprocess.CalledProcessError:
             return ""
     
+    def iter_staged_diff(self) -> Iterator[str]:
+        """Yield the staged diff line by line as git produces it."""
+        process = subprocess.Popen(
+            ["git", "diff", "--cached", "--no-color"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.repo_path,
+        )
+        try:
+            for line in process.stdout:
+                yield line.decode("utf-8", "replace")
+        finally:
+            # Closing the pipe lets git exit early if the consumer stopped reading
+            process.stdout.close()
+            process.wait()
+    
     def get_unstaged_diff(self) -> str:
         """Get the diff of unstaged changes."""
         try:
             result = subprocess.run(
                 ["git", "diff", "--no-color"],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 check=True,
             )
-            return result.stdout
+            return result.stdout.decode("utf-8", "replace")
         except subprocess.CalledProcessError:
             return ""
     
@@ -111,9 +190,9 @@ class GitWrapper:
         """Get unique file extensions from a list of files."""
         extensions = set()
         for file_path in files:
-            path = Path(file_path)
-            if path.suffix:
-                extensions.add(path.suffix.lower())
+            suffix = os.path.splitext(file_path)[1]
+            if suffix:
+                extensions.add(suffix.lower())
         return sorted(list(extensions))
     
     def get_file_types(self, files: List[str]) -> Dict[str, List[str]]:
@@ -128,79 +207,35 @@ class GitWrapper:
         }
         
         for file_path in files:
-            path = Path(file_path)
-            suffix = path.suffix.lower()
+            name = os.path.basename(file_path).lower()
+            category = SUFFIX_CATEGORIES.get(os.path.splitext(name)[1], "other")
             
-            # Code files
-            if suffix in {".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".c", ".cpp", ".h", ".hpp", ".go", ".rs", ".php", ".rb", ".swift", ".kt", ".scala"}:
-                categories["code"].append(file_path)
-            # Documentation
-            elif suffix in {".md", ".txt", ".rst", ".adoc", ".tex"}:
-                categories["docs"].append(file_path)
-            elif "test" in path.name.lower() or suffix in {".test.js", ".test.ts", ".spec.js", ".spec.ts", "_test.py", "test_"}:
-                categories["tests"].append(file_path)
-            elif suffix in {".json", ".yaml", ".yml", ".toml", ".ini", ".cfg", ".conf", ".env"}:
-                categories["config"].append(file_path)
-            # Assets
-            elif suffix in {".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico", ".css", ".scss", ".sass", ".less"}:
-                categories["assets"].append(file_path)
-            else:
-                categories["other"].append(file_path)
+            if name.endswith(TEST_NAME_SUFFIXES) or name.startswith(TEST_NAME_PREFIX):
+                category = "tests"
+            elif "test" in name and category not in ("code", "docs"):
+                category = "tests"
+            
+            categories[category].append(file_path)
         
         return categories
     
     def get_commit_stats(self) -> Dict[str, int]:
         """Get statistics about staged changes."""
-        try:
-            result = subprocess.run(
-                ["git", "diff", "--cached", "--stat"],
-                capture_output=True,
-                text=True,
-                cwd=self.repo_path,
-                check=True,
-            )
-            
-            # Parse the last line which contains summary
-            lines = result.stdout.strip().split("\n")
-            if not lines:
-                return {"files": 0, "insertions": 0, "deletions": 0}
-            
-            # Find the summary line (usually the last line)
-            summary_line = lines[-1]
-            
-            # Extract numbers using regex-like parsing
-            import re
-            pattern = r"(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?"
-            match = re.search(pattern, summary_line)
-            
-            if match:
-                files = int(match.group(1))
-                insertions = int(match.group(2)) if match.group(2) else 0
-                deletions = int(match.group(3)) if match.group(3) else 0
-                return {
-                    "files": files,
-                    "insertions": insertions,
-                    "deletions": deletions,
-                }
-            
-            return {"files": 0, "insertions": 0, "deletions": 0}
-            
-        except subprocess.CalledProcessError:
-            return {"files": 0, "insertions": 0, "deletions": 0}
+        return dict(self._load_staged_once()["stats"])
     
+    @_memo
     def get_recent_commits(self, count: int = 5) -> List[Dict[str, str]]:
         """Get recent commit history."""
         try:
             result = subprocess.run(
                 ["git", "log", f"-{count}", "--oneline", "--no-merges"],
                 capture_output=True,
-                text=True,
                 cwd=self.repo_path,
                 check=True,
             )
             
             commits = []
-            for line in result.stdout.strip().split("\n"):
+            for line in result.stdout.decode("utf-8", "replace").splitlines():
                 if line:
                     parts = line.split(" ", 1)
                     if len(parts) == 2:
@@ -213,6 +248,7 @@ class GitWrapper:
         except subprocess.CalledProcessError:
             return []
     
+    @_memo
     def get_remote_url(self) -> Optional[str]:
         """Get the remote URL of the repository."""
         try:
@@ -254,6 +290,8 @@ class GitWrapper:
                 cwd=self.repo_path,
                 check=False,
             )
+            # The index and HEAD have changed, so cached queries are stale
+            self._cache.clear()
             
             if result.returncode == 0:
                 return True
@@ -266,27 +304,31 @@ class GitWrapper:
     def get_branch_info(self) -> Dict[str, str]:
         """Get comprehensive branch information."""
         try:
-            current_branch = self.get_current_branch()
-            remote_url = self.get_remote_url()
+            # One local status call reports both the branch and its upstream
+            result = subprocess.run(
+                ["git", "status", "--porcelain=v2", "--branch", "-z", "--untracked-files=no"],
+                capture_output=True,
+                text=True,
+                cwd=self.repo_path,
+                check=True,
+            )
             
-            # Check if branch exists on remote
+            current_branch = None
             has_remote = False
-            if remote_url:
-                try:
-                    result = subprocess.run(
-                        ["git", "ls-remote", "--heads", "origin", current_branch],
-                        capture_output=True,
-                        text=True,
-                        cwd=self.repo_path,
-                        check=True,
-                    )
-                    has_remote = bool(result.stdout.strip())
-                except subprocess.CalledProcessError:
-                    pass
+            for entry in result.stdout.split("\0"):
+                if not entry.startswith("# branch."):
+                    break
+                if entry.startswith("# branch.head "):
+                    current_branch = entry[len("# branch.head "):]
+                elif entry.startswith("# branch.upstream "):
+                    has_remote = True
+            
+            if not current_branch or current_branch == "(detached)":
+                current_branch = self.get_current_branch()
             
             return {
                 "name": current_branch,
-                "remote_url": remote_url or "",
+                "remote_url": self.get_remote_url() or "",
                 "has_remote": has_remote,
             }
         except Exception:
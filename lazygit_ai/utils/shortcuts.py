@@ -4,13 +4,55 @@ LazyGit shortcut management for lazygit-ai.
 Handles installation and management of custom commands in LazyGit configuration.
 """
 
+import os
+import re
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+# Use the libyaml C bindings when PyYAML was built with them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Recommended shortcuts; get_default_shortcuts hands out copies
+DEFAULT_SHORTCUTS = (
+    {
+        "key": "C",
+        "context": "files",
+        "command": "lazygit-ai commit",
+        "description": "AI commit",
+        "subprocess": True,
+    },
+    {
+        "key": "A",
+        "context": "files",
+        "command": "lazygit-ai commit --no-ai",
+        "description": "Rule-based commit",
+        "subprocess": True,
+    },
+    {
+        "key": "X",
+        "context": "files",
+        "command": "lazygit-ai commit --copy",
+        "description": "Copy commit message",
+        "subprocess": True,
+    },
+)
+
+# get_shortcut_yaml output for keys and contexts that YAML emits as plain scalars
+SHORTCUT_YAML_TEMPLATE = (
+    "- key: {key}\n"
+    "  context: {context}\n"
+    "  command: lazygit-ai commit\n"
+    "  description: AI commit\n"
+    "  subprocess: true\n"
+)
+PLAIN_SCALAR_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*\Z")
+YAML_RESERVED_WORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+
 
 class LazyGitShortcutManager:
     """Manages LazyGit shortcuts for lazygit-ai."""
@@ -19,39 +61,105 @@ class LazyGitShortcutManager:
         """Initialize shortcut manager."""
         self.config_dir = Path.home() / ".config" / "lazygit"
         self.config_file = self.config_dir / "config.yml"
+        # Plain string paths for the frequent stat calls, avoiding pathlib wrappers
+        self._config_dir_str = str(self.config_dir)
+        self._config_file_str = str(self.config_file)
         self._config: Optional[Dict] = None
+        # (mtime_ns, size) of the file the cached config was read from or written to
+        self._config_stat: Optional[Tuple[int, int]] = None
+        # (position, entry) in customCommands keyed by (key, context), rebuilt on every (re)load
+        self._index: Dict[Tuple[str, str], Tuple[int, Dict]] = {}
+        # Exact bytes last read from or written to the config file
+        self._last_serialized: Optional[bytes] = None
+        self._lazygit_present: Optional[bool] = None
     
     def is_lazygit_installed(self) -> bool:
         """Check if LazyGit is installed and accessible."""
-        return shutil.which("lazygit") is not None
+        # PATH does not change during a run, so scan it only once
+        if self._lazygit_present is None:
+            self._lazygit_present = shutil.which("lazygit") is not None
+        return self._lazygit_present
     
     def _load_config(self) -> Dict:
         """Load LazyGit configuration."""
-        if self._config is not None:
+        stat = self._stat_config()
+        if stat is None:
+            self._config = self._get_default_config()
+            self._rebuild_index()
+            self._save_config()
             return self._config
         
-        if not self.config_file.exists():
+        # Reuse the parsed config unless the file changed on disk
+        if self._config is not None and stat == self._config_stat:
+            return self._config
+        
+        try:
+            with open(self._config_file_str, "rb") as f:
+                data = f.read()
+            self._config = yaml.load(data, Loader=YAML_LOADER) or {}
+            self._config.setdefault("customCommands", [])
+            self._last_serialized = data
+        except Exception:
             self._config = self._get_default_config()
-            self._save_config()
-        else:
-            try:
-                with open(self.config_file, "r") as f:
-                    self._config = yaml.safe_load(f) or {}
-            except Exception:
-                self._config = self._get_default_config()
+            self._last_serialized = None
+        self._config_stat = stat
+        self._rebuild_index()
         
         return self._config
     
+    def _rebuild_index(self) -> None:
+        """Index customCommands by (key, context) for constant-time lookups."""
+        commands = self._config.get("customCommands") or []
+        # Reversed so the first of any duplicates wins, as a linear scan would
+        self._index = {
+            (c.get("key"), c.get("context")): (i, c)
+            for i, c in reversed(list(enumerate(commands)))
+        }
+    
+    def _remove_shortcut(self, key: str, context: str) -> None:
+        """Delete an indexed shortcut by position and reindex the entries after it."""
+        i, _ = self._index.pop((key, context))
+        commands = self._config["customCommands"]
+        del commands[i]
+        
+        for j in range(i, len(commands)):
+            command = commands[j]
+            index_key = (command.get("key"), command.get("context"))
+            entry = self._index.get(index_key)
+            if entry is not None and entry[1] is command:
+                self._index[index_key] = (j, command)
+            elif entry is None and index_key == (key, context):
+                # A later duplicate of the removed entry becomes the indexed one
+                self._index[index_key] = (j, command)
+    
+    def _stat_config(self) -> Optional[Tuple[int, int]]:
+        """Return the config file's (mtime_ns, size), or None if it is missing."""
+        try:
+            stat = os.stat(self._config_file_str)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
     def _save_config(self) -> None:
         """Save LazyGit configuration."""
+        data = yaml.dump(self._config, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False, encoding="utf-8")
+        
+        # Leave the file untouched when it already holds exactly these bytes
+        if data == self._last_serialized and self._stat_config() == self._config_stat:
+            return
+        
         # Ensure config directory exists
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(self._config_dir_str, exist_ok=True)
         
         try:
-            with open(self.config_file, "w") as f:
-                yaml.dump(self._config, f, default_flow_style=False, sort_keys=False)
+            with open(self._config_file_str, "wb") as f:
+                f.write(data)
         except Exception as e:
             raise RuntimeError(f"Failed to save LazyGit configuration: {e}")
+        
+        # Our own write must not look like an external change
+        self._config_stat = self._stat_config()
+        self._last_serialized = data
     
     def _get_default_config(self) -> Dict:
         """Get default LazyGit configuration."""
@@ -69,21 +177,12 @@ class LazyGitShortcutManager:
             "customCommands": [],
         }
     
-    def _ensure_custom_commands_section(self) -> None:
-        """Ensure customCommands section exists in config."""
-        if "customCommands" not in self._config:
-            self._config["customCommands"] = []
-    
     def get_shortcut_command(self, key: str, context: str) -> Optional[Dict]:
         """Get existing shortcut command for key and context."""
         self._load_config()
-        self._ensure_custom_commands_section()
-        
-        for command in self._config["customCommands"]:
-            if command.get("key") == key and command.get("context") == context:
-                return command
         
-        return None
+        entry = self._index.get((key, context))
+        return entry[1] if entry else None
     
     def install_shortcut(self, key: str, context: str, force: bool = False) -> bool:
         """
@@ -97,8 +196,15 @@ class LazyGitShortcutManager:
         Returns:
             True if successful, False if shortcut already exists
         """
+        if not self._stage_shortcut(key, context, force):
+            return False
+        
+        self._save_config()
+        return True
+    
+    def _stage_shortcut(self, key: str, context: str, force: bool) -> bool:
+        """Add a shortcut to the in-memory config without saving it."""
         self._load_config()
-        self._ensure_custom_commands_section()
         
         # Check if shortcut already exists
         existing = self.get_shortcut_command(key, context)
@@ -107,7 +213,7 @@ class LazyGitShortcutManager:
         
         # Remove existing shortcut if force is True
         if existing and force:
-            self._config["customCommands"].remove(existing)
+            self._remove_shortcut(key, context)
         
         # Create new shortcut
         shortcut = {
@@ -118,9 +224,10 @@ class LazyGitShortcutManager:
             "subprocess": True,
         }
         
-        self._config["customCommands"].append(shortcut)
-        self._save_config()
-        
+        commands = self._config["customCommands"]
+        # A remaining duplicate sits earlier in the list, so it stays the indexed one
+        self._index.setdefault((key, context), (len(commands), shortcut))
+        commands.append(shortcut)
         return True
     
     def uninstall_shortcut(self, key: str, context: str) -> bool:
@@ -135,13 +242,12 @@ class LazyGitShortcutManager:
             True if shortcut was removed, False if not found
         """
         self._load_config()
-        self._ensure_custom_commands_section()
         
         existing = self.get_shortcut_command(key, context)
         if not existing:
             return False
         
-        self._config["customCommands"].remove(existing)
+        self._remove_shortcut(key, context)
         self._save_config()
         
         return True
@@ -149,7 +255,6 @@ class LazyGitShortcutManager:
     def list_shortcuts(self) -> List[Dict]:
         """List all installed shortcuts."""
         self._load_config()
-        self._ensure_custom_commands_section()
         
         return self._config["customCommands"].copy()
     
@@ -159,10 +264,13 @@ class LazyGitShortcutManager:
     
     def backup_config(self) -> Path:
         """Create a backup of the current LazyGit configuration."""
-        if not self.config_file.exists():
+        try:
+            stat = os.stat(self._config_file_str)
+        except FileNotFoundError:
             raise FileNotFoundError("LazyGit configuration file not found")
         
-        backup_path = self.config_file.with_suffix(f".backup.{int(Path().stat().st_mtime)}")
+        # Name the backup after the config file's own modification time
+        backup_path = self.config_file.with_suffix(f".backup.{stat.st_mtime_ns}")
         
         try:
             shutil.copy2(self.config_file, backup_path)
@@ -203,6 +311,13 @@ class LazyGitShortcutManager:
     
     def get_shortcut_yaml(self, key: str, context: str) -> str:
         """Get YAML representation of a shortcut for documentation."""
+        if all(
+            isinstance(value, str) and PLAIN_SCALAR_RE.match(value) and value.lower() not in YAML_RESERVED_WORDS
+            for value in (key, context)
+        ):
+            return SHORTCUT_YAML_TEMPLATE.format(key=key, context=context)
+        
+        # Values YAML would quote or retype still go through the emitter
         shortcut = {
             "key": key,
             "context": context,
@@ -211,7 +326,7 @@ class LazyGitShortcutManager:
             "subprocess": True,
         }
         
-        return yaml.dump([shortcut], default_flow_style=False, sort_keys=False)
+        return yaml.dump([shortcut], Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
     
     def install_multiple_shortcuts(self, shortcuts: List[Dict], force: bool = False) -> Dict[str, bool]:
         """
@@ -231,36 +346,18 @@ class LazyGitShortcutManager:
             context = shortcut.get("context")
             
             if key and context:
-                success = self.install_shortcut(key, context, force)
+                success = self._stage_shortcut(key, context, force)
                 results[f"{key}:{context}"] = success
         
+        # Write once for the whole batch
+        if any(results.values()):
+            self._save_config()
+        
         return results
     
     def get_default_shortcuts(self) -> List[Dict]:
         """Get recommended default shortcuts for lazygit-ai."""
-        return [
-            {
-                "key": "C",
-                "context": "files",
-                "command": "lazygit-ai commit",
-                "description": "AI commit",
-                "subprocess": True,
-            },
-            {
-                "key": "A",
-                "context": "files",
-                "command": "lazygit-ai commit --no-ai",
-                "description": "Rule-based commit",
-                "subprocess": True,
-            },
-            {
-                "key": "X",
-                "context": "files",
-                "command": "lazygit-ai commit --copy",
-                "description": "Copy commit message",
-                "subprocess": True,
-            },
-        ]
+        return [dict(shortcut) for shortcut in DEFAULT_SHORTCUTS]
     
     def install_default_shortcuts(self, force: bool = False) -> Dict[str, bool]:
         """Install recommended default shortcuts."""
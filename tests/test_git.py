@@ -0,0 +1,92 @@
+"""
+Tests for the git output parsers used by lazygit-ai.
+"""
+
+import subprocess
+
+import pytest
+
+from lazygit_ai.core.analyzer import GitAnalyzer
+from lazygit_ai.utils.git import GitWrapper
+
+
+def git(repo, *args):
+    """Run a git command inside the test repository."""
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with one commit holding a few text files."""
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.name", "Test")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "diff.renames", "true")
+    git(tmp_path, "config", "core.quotePath", "true")
+    
+    (tmp_path / "old.txt").write_text("one\ntwo\nthree\n")
+    (tmp_path / "tab\tname.txt").write_text("a\n")
+    (tmp_path / "gone.txt").write_text("bye\n")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def test_staged_snapshot_handles_renames_binary_and_tabs(repo):
+    git(repo, "mv", "old.txt", "new.txt")
+    (repo / "tab\tname.txt").write_text("a\nb\nc\n")
+    (repo / "image.bin").write_bytes(b"\x00\x01\x02")
+    git(repo, "add", "-A")
+    
+    wrapper = GitWrapper(repo)
+    
+    assert sorted(wrapper.get_staged_files()) == ["image.bin", "new.txt", "tab\tname.txt"]
+    # The binary file counts as a file but contributes no lines
+    assert wrapper.get_commit_stats() == {"files": 3, "insertions": 2, "deletions": 0}
+
+
+def test_staged_snapshot_counts_deletions(repo):
+    git(repo, "rm", "-q", "gone.txt")
+    
+    wrapper = GitWrapper(repo)
+    
+    assert wrapper.get_staged_files() == ["gone.txt"]
+    assert wrapper.get_commit_stats() == {"files": 1, "insertions": 0, "deletions": 1}
+
+
+def test_staged_snapshot_is_empty_without_changes(repo):
+    wrapper = GitWrapper(repo)
+    
+    assert wrapper.get_staged_files() == []
+    assert wrapper.get_commit_stats() == {"files": 0, "insertions": 0, "deletions": 0}
+
+
+def test_staged_snapshot_skips_unmerged_paths(repo):
+    git(repo, "checkout", "-q", "-b", "other")
+    (repo / "old.txt").write_text("theirs\n")
+    git(repo, "commit", "-q", "-am", "theirs")
+    git(repo, "checkout", "-q", "-")
+    (repo / "old.txt").write_text("ours\n")
+    git(repo, "commit", "-q", "-am", "ours")
+    subprocess.run(["git", "merge", "-q", "other"], cwd=repo, capture_output=True)
+    
+    wrapper = GitWrapper(repo)
+    
+    assert wrapper.get_staged_files() == []
+    assert not wrapper.check_commit_readiness()["ready"]
+
+
+def test_unstaged_files_skip_rename_sources(repo):
+    # Byte 1 of "aM.txt" reads as an "M" status if the source path is not skipped
+    (repo / "aM.txt").write_text("source\n")
+    git(repo, "add", "aM.txt")
+    git(repo, "commit", "-q", "-m", "add rename source")
+    git(repo, "mv", "aM.txt", "new.txt")
+    (repo / "new.txt").write_text("changed after the rename\n")
+    (repo / "tab\tname.txt").write_text("edited\n")
+    (repo / "gone.txt").unlink()
+    (repo / "untracked.txt").write_text("new\n")
+    
+    analyzer = GitAnalyzer(GitWrapper(repo))
+    
+    assert sorted(analyzer._get_unstaged_files()) == ["gone.txt", "new.txt", "tab\tname.txt"]
@@ -0,0 +1,24 @@
+"""
+Tests for the rule-based commit message engine.
+"""
+
+import pytest
+
+from lazygit_ai.core.rules import EnhancedRuleEngine
+from lazygit_ai.utils.config import ConfigManager
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Rule engine backed by a default config under a temporary HOME."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return EnhancedRuleEngine(ConfigManager())
+
+
+@pytest.mark.parametrize("space", [" ", "  ", "\t", "\n", "\xa0", "\u2003", "\x1c", "\x85"])
+def test_clean_description_normalizes_whitespace(engine, space):
+    assert engine._clean_description(f"  the{space}bug ") == "The bug"
+
+
+def test_clean_description_strips_prefix(engine):
+    assert engine._clean_description("TODO:  handle empty   input") == "Handle empty input"
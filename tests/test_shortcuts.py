@@ -0,0 +1,115 @@
+"""
+Tests for LazyGit shortcut management.
+"""
+
+import os
+
+import pytest
+import yaml
+
+from lazygit_ai.utils.shortcuts import LazyGitShortcutManager
+
+
+DUPLICATE_CONFIG = """\
+customCommands:
+- key: C
+  context: files
+  command: first
+- key: A
+  context: files
+  command: other
+- key: C
+  context: files
+  command: second
+"""
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Shortcut manager whose LazyGit config lives under a temporary HOME."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return LazyGitShortcutManager()
+
+
+def write_config(manager, text):
+    """Write a raw LazyGit config file for the manager to load."""
+    manager.config_dir.mkdir(parents=True, exist_ok=True)
+    manager.config_file.write_text(text)
+
+
+def saved_commands(manager):
+    """Read customCommands back from disk."""
+    return yaml.safe_load(manager.config_file.read_text())["customCommands"]
+
+
+def test_uninstall_removes_every_duplicate(manager):
+    write_config(manager, DUPLICATE_CONFIG)
+    
+    assert manager.get_shortcut_command("C", "files")["command"] == "first"
+    assert manager.uninstall_shortcut("C", "files")
+    assert manager.get_shortcut_command("C", "files")["command"] == "second"
+    assert manager.uninstall_shortcut("C", "files")
+    assert not manager.uninstall_shortcut("C", "files")
+    
+    assert [c["key"] for c in saved_commands(manager)] == ["A"]
+
+
+def test_install_sees_remaining_duplicate(manager):
+    write_config(manager, DUPLICATE_CONFIG)
+    
+    assert manager.uninstall_shortcut("C", "files")
+    assert not manager.install_shortcut("C", "files")
+    
+    assert [c["command"] for c in saved_commands(manager)] == ["other", "second"]
+
+
+def test_force_install_replaces_first_duplicate(manager):
+    write_config(manager, DUPLICATE_CONFIG)
+    
+    assert manager.install_shortcut("C", "files", force=True)
+    
+    commands = saved_commands(manager)
+    assert [c["command"] for c in commands] == ["other", "second", "lazygit-ai commit"]
+    assert manager.get_shortcut_command("C", "files")["command"] == "second"
+
+
+def test_backup_suffix_uses_config_mtime(manager, tmp_path, monkeypatch):
+    write_config(manager, DUPLICATE_CONFIG)
+    mtime_ns = 1_600_000_000_123_456_789
+    os.utime(manager.config_file, ns=(mtime_ns, mtime_ns))
+    # Run from a directory whose own mtime differs from the config file's
+    monkeypatch.chdir(tmp_path)
+    
+    backup_path = manager.backup_config()
+    
+    st_mtime_ns = os.stat(manager.config_file).st_mtime_ns
+    assert backup_path.name.endswith(str(st_mtime_ns))
+    assert st_mtime_ns != os.stat(tmp_path).st_mtime_ns
+    assert backup_path.read_text() == DUPLICATE_CONFIG
+
+
+@pytest.mark.parametrize("key", ["C", "y", "N", "<c-a>", "1", "on", "~", ":", "#"])
+@pytest.mark.parametrize("context", ["files", "localBranches", "commit-files", "yes"])
+def test_shortcut_yaml_matches_yaml_dump(manager, key, context):
+    expected = yaml.dump(
+        [{
+            "key": key,
+            "context": context,
+            "command": "lazygit-ai commit",
+            "description": "AI commit",
+            "subprocess": True,
+        }],
+        default_flow_style=False,
+        sort_keys=False,
+    )
+    
+    assert manager.get_shortcut_yaml(key, context) == expected
+
+
+def test_shortcut_yaml_uses_template_for_plain_keys(manager, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("yaml.dump should not run for plain keys")
+    
+    monkeypatch.setattr(yaml, "dump", fail)
+    
+    assert manager.get_shortcut_yaml("C", "files").startswith("- key: C\n  context: files\n")
@@ -0,0 +1,103 @@
+"""
+Tests for the in-place commit message editor.
+"""
+
+import os
+import select
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from lazygit_ai.ui.tui import SimpleCommitTUI
+
+pty = pytest.importorskip("pty")
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# edit() refuses to run under pytest, so drive it from a separate interpreter
+EDITOR_SCRIPT = """\
+import sys
+from lazygit_ai.ui.tui import InPlaceEditor
+result = InPlaceEditor(sys.argv[2]).edit(1, 1)
+with open(sys.argv[1], "w", encoding="utf-8") as f:
+    f.write(result)
+"""
+
+
+def read_until(fd, marker, timeout=10.0):
+    """Read terminal output until the marker appears."""
+    output = b""
+    deadline = time.monotonic() + timeout
+    while marker not in output and time.monotonic() < deadline:
+        if select.select([fd], [], [], 0.1)[0]:
+            output += os.read(fd, 1024)
+    return output
+
+
+def run_editor(tmp_path, initial, keys):
+    """Run the editor in a pseudo-terminal, type keys, and return the edited text."""
+    result_file = tmp_path / "result.txt"
+    master, slave = pty.openpty()
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    proc = subprocess.Popen(
+        [sys.executable, "-c", EDITOR_SCRIPT, str(result_file), initial],
+        stdin=slave,
+        stdout=slave,
+        stderr=slave,
+        env=env,
+    )
+    os.close(slave)
+    try:
+        # The initial text is echoed only once the terminal is in raw mode
+        read_until(master, initial.encode())
+        os.write(master, keys)
+        proc.wait(timeout=10)
+    finally:
+        os.close(master)
+    return result_file.read_text(encoding="utf-8")
+
+
+def test_burst_with_non_ascii_whitespace_is_kept(tmp_path):
+    pasted = " pasted\xa0text here"
+    
+    assert run_editor(tmp_path, "msg", pasted.encode() + b"\r") == "msg" + pasted
+
+
+def test_burst_inserted_before_existing_text_is_kept(tmp_path):
+    # HOME moves the cursor to the start so the run goes through insert-character
+    typed = "\u2003x"
+    
+    assert run_editor(tmp_path, "msg", b"\x1b[H" + typed.encode() + b"\r") == typed + "msg"
+
+
+@pytest.fixture
+def tui(monkeypatch):
+    """TUI over a fixed analysis that records redraws instead of painting."""
+    analysis = SimpleNamespace(branch_name="main", staged_files=["a.txt"], change_summary="1 file")
+    tui = SimpleCommitTUI("msg", analysis, None)
+    tui.redraws = []
+    monkeypatch.setattr(tui, "_redraw", lambda *lines: tui.redraws.append(lines))
+    return tui
+
+
+@pytest.mark.parametrize("answer", ["msg", "  msg ", ""])
+def test_kept_message_is_not_redrawn(tui, monkeypatch, answer):
+    monkeypatch.setattr(tui.console, "input", lambda prompt: answer)
+    
+    tui._handle_edit()
+    
+    assert tui.message == "msg"
+    assert tui.redraws == []
+
+
+def test_changed_message_is_redrawn(tui, monkeypatch):
+    monkeypatch.setattr(tui.console, "input", lambda prompt: " new msg ")
+    
+    tui._handle_edit()
+    
+    assert tui.message == "new msg"
+    assert len(tui.redraws) == 1